@@ -7,254 +7,507 @@ Checks DMA configuration, clock settings, interrupt priorities, and peripheral c
 
 Usage:
     python validate_cubemx_config.py <path_to_project.ioc>
+    python validate_cubemx_config.py <directory_or_ioc> [<directory_or_ioc> ...]
+    python validate_cubemx_config.py --cache [--cache-file FILE] <directory_or_ioc> [...]
+
+Directories are searched recursively for .ioc files. When more than one file
+is given, files are validated in parallel and a summary is printed at the end.
+With --cache, files whose contents are unchanged since their last validation
+are skipped and their previous result is reused.
 """
 
+import argparse
+import hashlib
+import json
+import mmap
+import os
 import sys
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
-
-# Platform requirements
-REQUIREMENTS = {
-    "dma": {
-        "UART_RX_MODE": "CIRCULAR",
-        "UART_RX_PRIORITY": "HIGH",
-        "UART_TX_MODE": "NORMAL",
-        "UART_TX_PRIORITY": "MEDIUM",
-        "SPI_MODE": "NORMAL",
-        "ADC_MODE": "CIRCULAR",
-    },
-    "interrupts": {
-        "DMA_PREEMPT": "5",
-        "DMA_SUB": "0",
-        "PERIPHERAL_PREEMPT": "6",
-        "PERIPHERAL_SUB": "0",
-    },
-    "clock": {
-        "APB1_MIN": 42_000_000,  # 42 MHz for CAN timing
-        "APB1_MAX": 50_000_000,
-        "APB2_MIN": 80_000_000,  # High-speed peripherals
-        "APB2_MAX": 100_000_000,
-    },
-    "can": {
-        "BAUDRATE": 500_000,  # 500 kbit/s
-        "AUTO_RETRANSMIT": "ENABLE",
-        "MODE": "NORMAL",
-    }
-}
+from types import MappingProxyType
+from typing import Dict, Final, List, Optional, Tuple
+
+DEFAULT_CACHE_FILE = Path(".ioc_validate_cache.json")
+
+# Report banners, built once; templates are filled with str.format_map()
+SEP = "=" * 60
+HEADER_TMPL = f"\n{SEP}\nSTM32CubeMX Configuration Validator\nFile: {{name}}\n{SEP}"
+RESULTS_BANNER = f"\n{SEP}\nValidation Results\n{SEP}"
+SUMMARY_TMPL = f"\n{SEP}\nBatch Results: {{passed}}/{{total}} files passed\n{SEP}"
+
+# Platform requirements, read-only so no caller (or worker) can alter them
+DMA_REQ: Final = MappingProxyType({
+    "UART_RX_MODE": "CIRCULAR",
+    "UART_RX_PRIORITY": "HIGH",
+    "UART_TX_MODE": "NORMAL",
+    "UART_TX_PRIORITY": "MEDIUM",
+    "SPI_MODE": "NORMAL",
+    "ADC_MODE": "CIRCULAR",
+})
+
+INTERRUPT_REQ: Final = MappingProxyType({
+    "DMA_PREEMPT": "5",
+    "DMA_SUB": "0",
+    "PERIPHERAL_PREEMPT": "6",
+    "PERIPHERAL_SUB": "0",
+})
+
+CLOCK_REQ: Final = MappingProxyType({
+    "APB1_MIN": 42_000_000,  # 42 MHz for CAN timing
+    "APB1_MAX": 50_000_000,
+    "APB2_MIN": 80_000_000,  # High-speed peripherals
+    "APB2_MAX": 100_000_000,
+})
+
+CAN_REQ: Final = MappingProxyType({
+    "BAUDRATE": 500_000,  # 500 kbit/s
+    "AUTO_RETRANSMIT": "ENABLE",
+    "MODE": "NORMAL",
+})
+
+REQUIREMENTS: Final = MappingProxyType({
+    "dma": DMA_REQ,
+    "interrupts": INTERRUPT_REQ,
+    "clock": CLOCK_REQ,
+    "can": CAN_REQ,
+})
+
+# Exact-match rules: (ioc_key, expected_value, severity, label)
+DMA_RULES = (
+    ("Dma.USART2_RX.0.Mode", DMA_REQ["UART_RX_MODE"], "error", "UART RX DMA mode"),
+    ("Dma.USART2_TX.1.Mode", DMA_REQ["UART_TX_MODE"], "warning", "UART TX DMA mode"),
+    ("Dma.ADC1.0.Mode", DMA_REQ["ADC_MODE"], "error", "ADC DMA mode"),
+)
+
+INTERRUPT_RULES = (
+    ("NVIC.DMA2_Stream0_IRQn.0.PreemptionPriority", INTERRUPT_REQ["DMA_PREEMPT"],
+     "warning", "DMA preemption priority"),
+    ("NVIC.DMA2_Stream0_IRQn.0.SubPriority", INTERRUPT_REQ["DMA_SUB"],
+     "warning", "DMA sub-priority"),
+)
+
+# Clock bus bounds (Hz), unpacked so range checks compare plain ints
+APB1_LO, APB1_HI = CLOCK_REQ["APB1_MIN"], CLOCK_REQ["APB1_MAX"]
+APB2_LO, APB2_HI = CLOCK_REQ["APB2_MIN"], CLOCK_REQ["APB2_MAX"]
+
+# Clock ranges as shown in report messages, formatted once
+APB1_RANGE_STR = f"{APB1_LO / 1e6:.0f}-{APB1_HI / 1e6:.0f} MHz"
+APB2_RANGE_STR = f"{APB2_LO / 1e6:.0f}-{APB2_HI / 1e6:.0f} MHz"
+
+# CAN1 settings read by the CAN check, fetched together: (mode, prescaler, NART)
+CAN_KEYS = ("CAN1.Mode", "CAN1.Prescaler", "CAN1.NART")
+
+# Every .ioc key the checks read. load_config() keeps only these entries, so
+# a key must be listed here before get_value() can see it (the RCC clock
+# entries are then moved out into typed fields).
+NEEDED_KEYS = frozenset(
+    key.encode('utf-8') for key in (
+        *(rule[0] for rule in DMA_RULES + INTERRUPT_RULES),
+        "RCC.APB1Freq_Value",
+        "RCC.APB2Freq_Value",
+        *CAN_KEYS,
+        "ProjectManager.KeepUserCode",
+        "ProjectManager.DeletePrevious",
+    )
+)
+
+
+def _build_trie(keys) -> Dict[bytes, dict]:
+    """Build a nested-dict trie of byte strings; b"" marks the end of a key"""
+    trie: Dict[bytes, dict] = {}
+    for key in keys:
+        node = trie
+        for i in range(len(key)):
+            node = node.setdefault(key[i:i + 1], {})
+        node[b""] = {}
+    return trie
+
+
+def _trie_pattern(node: Dict[bytes, dict]) -> bytes:
+    """Render a trie as a regex in which keys sharing a prefix share its match"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if b"" in node:
+        branches.append(b"")  # A key may end here, or continue into a longer one
+    if len(branches) == 1:
+        return branches[0]
+    return b"(?:" + b"|".join(branches) + b")"
+
+
+# Common-prefix trie over NEEDED_KEYS: "Dma.", "CAN1." and the long
+# "NVIC.DMA2_Stream0_IRQn.0." prefix are each matched once per line, and the
+# root level dispatches on a line's first byte.
+NEEDED_TRIE = _build_trie(NEEDED_KEYS)
+
+# Compiled once at import so validating many files never recompiles it.
+# Matches "key=value" lines whose key is one of NEEDED_KEYS, so a single scan
+# finds every entry of interest; comments and other keys never match.
+# Whitespace is allowed before the key, around '=' and at end of line, as if
+# each line were stripped. Bytes pattern so it can run directly over the
+# memory-mapped file (CRLF endings are trimmed too).
+_NEEDED_RE = re.compile(
+    rb'^[ \t]*(' + _trie_pattern(NEEDED_TRIE) + rb')[ \t]*=[ \t]*(.*?)[ \t\r]*$',
+    re.M,
+)
+
+
+def _parse_freq(raw: bytes) -> Optional[int]:
+    """Convert a raw .ioc frequency to Hz, or None if it is not a plain number"""
+    # CubeMX writes frequencies as ASCII digit strings; bytes.isdigit() is
+    # ASCII-only, so checking it avoids relying on int() raising
+    return int(raw) if raw.isdigit() else None
+
+
+def _mismatch(label: str, expected: str, found: str) -> str:
+    """Format the message for a setting that does not have its expected value"""
+    return f"{label}: Expected {expected}, found '{found}'"
 
 
 class IocValidator:
     """Validator for STM32CubeMX .ioc configuration files"""
 
+    # Every instance attribute must be listed here; there is no __dict__
+    __slots__ = ("ioc_path", "config", "apb1_freq", "apb2_freq", "errors", "warnings", "_out")
+
+    ioc_path: Path
+    config: Dict[bytes, bytes]
+    apb1_freq: Optional[int]  # Hz; None if the .ioc value is not a number
+    apb2_freq: Optional[int]
+    errors: List[str]
+    warnings: List[str]
+    _out: List[str]  # Report lines, written to stdout in one go
+
     def __init__(self, ioc_path: Path):
         self.ioc_path = ioc_path
-        self.config: Dict[str, str] = {}
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self.config = {}
+        self.errors = []
+        self.warnings = []
+        self._out = []
         self.load_config()
 
     def load_config(self):
-        """Load .ioc file into dictionary"""
+        """Load the needed .ioc entries into a dictionary of raw (undecoded) values"""
         if not self.ioc_path.exists():
             raise FileNotFoundError(f"IOC file not found: {self.ioc_path}")
 
-        with open(self.ioc_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if '=' in line and not line.startswith('#'):
-                    key, value = line.split('=', 1)
-                    self.config[key.strip()] = value.strip()
-
-    def get_value(self, key: str, default: str = "") -> str:
-        """Get configuration value by key"""
-        return self.config.get(key, default)
-
-    def validate_dma_config(self):
-        """Validate DMA configuration for UART, SPI, ADC"""
-        print("\n[DMA Configuration]")
-
-        # Check UART DMA
-        uart_rx_dma = self.get_value("Dma.USART2_RX.0.Mode", "")
-        uart_tx_dma = self.get_value("Dma.USART2_TX.1.Mode", "")
+        with open(self.ioc_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Scan the whole file: if a key repeats, its last value wins
+                    self.config = dict(_NEEDED_RE.findall(mm))
 
-        if uart_rx_dma != REQUIREMENTS["dma"]["UART_RX_MODE"]:
-            self.errors.append(
-                f"UART RX DMA mode: Expected {REQUIREMENTS['dma']['UART_RX_MODE']}, "
-                f"found '{uart_rx_dma}'"
-            )
-        else:
-            print(f"  ✓ UART RX DMA mode: {uart_rx_dma}")
-
-        if uart_tx_dma != REQUIREMENTS["dma"]["UART_TX_MODE"]:
-            self.warnings.append(
-                f"UART TX DMA mode: Expected {REQUIREMENTS['dma']['UART_TX_MODE']}, "
-                f"found '{uart_tx_dma}'"
-            )
-        else:
-            print(f"  ✓ UART TX DMA mode: {uart_tx_dma}")
-
-        # Check ADC DMA
-        adc_dma_mode = self.get_value("Dma.ADC1.0.Mode", "")
-        if adc_dma_mode != REQUIREMENTS["dma"]["ADC_MODE"]:
-            self.errors.append(
-                f"ADC DMA mode: Expected {REQUIREMENTS['dma']['ADC_MODE']}, "
-                f"found '{adc_dma_mode}'"
-            )
-        else:
-            print(f"  ✓ ADC DMA mode: {adc_dma_mode}")
+        # Clock frequencies are converted once here and kept as typed fields
+        # rather than config entries; a missing value counts as 0 Hz
+        self.apb1_freq = _parse_freq(self.config.pop(b"RCC.APB1Freq_Value", b"0"))
+        self.apb2_freq = _parse_freq(self.config.pop(b"RCC.APB2Freq_Value", b"0"))
 
-    def validate_interrupts(self):
-        """Validate interrupt priority configuration"""
-        print("\n[Interrupt Configuration]")
-
-        # Check DMA interrupt priorities
-        dma_preempt = self.get_value("NVIC.DMA2_Stream0_IRQn.0.PreemptionPriority", "")
-        dma_sub = self.get_value("NVIC.DMA2_Stream0_IRQn.0.SubPriority", "")
-
-        if dma_preempt != REQUIREMENTS["interrupts"]["DMA_PREEMPT"]:
-            self.warnings.append(
-                f"DMA preemption priority: Expected {REQUIREMENTS['interrupts']['DMA_PREEMPT']}, "
-                f"found '{dma_preempt}'"
-            )
-        else:
-            print(f"  ✓ DMA preemption priority: {dma_preempt}")
-
-        if dma_sub != REQUIREMENTS["interrupts"]["DMA_SUB"]:
-            self.warnings.append(
-                f"DMA sub-priority: Expected {REQUIREMENTS['interrupts']['DMA_SUB']}, "
-                f"found '{dma_sub}'"
-            )
-
-    def validate_clock_config(self):
-        """Validate clock tree configuration"""
-        print("\n[Clock Configuration]")
-
-        # Extract APB1 and APB2 clock frequencies
-        apb1_freq_str = self.get_value("RCC.APB1Freq_Value", "0")
-        apb2_freq_str = self.get_value("RCC.APB2Freq_Value", "0")
-
-        try:
-            apb1_freq = int(apb1_freq_str)
-            apb2_freq = int(apb2_freq_str)
-        except ValueError:
-            self.errors.append("Failed to parse clock frequencies from IOC file")
+    def get_value(self, key: str, default: str = "") -> str:
+        """Get configuration value by key, decoding it on demand"""
+        value = self.config.get(key.encode('utf-8'))
+        return default if value is None else value.decode('utf-8')
+
+    def _match_rules(self, rules):
+        """Yield (severity, message) for exact-match rules, with "pass" for matches"""
+        for key, expected, severity, label in rules:
+            value = self.get_value(key)
+            if value != expected:
+                yield severity, _mismatch(label, expected, value)
+            else:
+                yield "pass", f"{label}: {value}"
+
+    def _rules_dma(self):
+        """Check DMA configuration for UART, SPI, ADC"""
+        yield from self._match_rules(DMA_RULES)
+
+    def _rules_interrupts(self):
+        """Check interrupt priority configuration"""
+        yield from self._match_rules(INTERRUPT_RULES)
+
+    def _rules_clock(self):
+        """Check clock tree configuration"""
+        # APB1 and APB2 clock frequencies, parsed by load_config()
+        apb1_freq = self.apb1_freq
+        apb2_freq = self.apb2_freq
+        if apb1_freq is None or apb2_freq is None:
+            yield "error", "Failed to parse clock frequencies from IOC file"
             return
 
         # Validate APB1 (CAN bus requires specific timing)
-        if not (REQUIREMENTS["clock"]["APB1_MIN"] <= apb1_freq <= REQUIREMENTS["clock"]["APB1_MAX"]):
-            self.errors.append(
+        if not (APB1_LO <= apb1_freq <= APB1_HI):
+            yield "error", (
                 f"APB1 frequency out of range: {apb1_freq / 1e6:.1f} MHz "
-                f"(expected {REQUIREMENTS['clock']['APB1_MIN'] / 1e6:.0f}-"
-                f"{REQUIREMENTS['clock']['APB1_MAX'] / 1e6:.0f} MHz)"
+                f"(expected {APB1_RANGE_STR})"
             )
         else:
-            print(f"  ✓ APB1 frequency: {apb1_freq / 1e6:.1f} MHz")
+            yield "pass", f"APB1 frequency: {apb1_freq / 1e6:.1f} MHz"
 
         # Validate APB2
-        if not (REQUIREMENTS["clock"]["APB2_MIN"] <= apb2_freq <= REQUIREMENTS["clock"]["APB2_MAX"]):
-            self.warnings.append(
+        if not (APB2_LO <= apb2_freq <= APB2_HI):
+            yield "warning", (
                 f"APB2 frequency out of optimal range: {apb2_freq / 1e6:.1f} MHz "
-                f"(recommended {REQUIREMENTS['clock']['APB2_MIN'] / 1e6:.0f}-"
-                f"{REQUIREMENTS['clock']['APB2_MAX'] / 1e6:.0f} MHz)"
+                f"(recommended {APB2_RANGE_STR})"
             )
         else:
-            print(f"  ✓ APB2 frequency: {apb2_freq / 1e6:.1f} MHz")
+            yield "pass", f"APB2 frequency: {apb2_freq / 1e6:.1f} MHz"
 
-    def validate_can_config(self):
-        """Validate CAN peripheral configuration"""
-        print("\n[CAN Configuration]")
+    def _rules_can(self):
+        """Check CAN peripheral configuration"""
+        can_mode, prescaler, auto_retx = map(self.get_value, CAN_KEYS)
 
         # Check if CAN is enabled
-        can_mode = self.get_value("CAN1.Mode", "")
         if not can_mode:
-            self.warnings.append("CAN1 not enabled (platform supports CAN)")
+            yield "warning", "CAN1 not enabled (platform supports CAN)"
             return
 
         # Check CAN prescaler and timing (baudrate calculation)
-        prescaler = self.get_value("CAN1.Prescaler", "")
         if prescaler:
-            print(f"  ✓ CAN prescaler configured: {prescaler}")
+            yield "pass", f"CAN prescaler configured: {prescaler}"
 
         # Check auto-retransmission
-        auto_retx = self.get_value("CAN1.NART", "")
         if auto_retx == "DISABLE":
-            print(f"  ✓ CAN auto-retransmit: ENABLED (NART=DISABLE)")
+            yield "pass", "CAN auto-retransmit: ENABLED (NART=DISABLE)"
         else:
-            self.warnings.append(
+            yield "warning", (
                 f"CAN auto-retransmit should be enabled (NART=DISABLE), found NART={auto_retx}"
             )
 
-    def validate_code_generation(self):
-        """Validate code generation settings"""
-        print("\n[Code Generation Settings]")
-
+    def _rules_code_generation(self):
+        """Check code generation settings"""
         keep_user_code = self.get_value("ProjectManager.KeepUserCode", "")
         if keep_user_code != "true":
-            self.errors.append(
-                "Code generation setting 'KeepUserCode' must be 'true' for platform integration"
-            )
+            yield "error", "Code generation setting 'KeepUserCode' must be 'true' for platform integration"
         else:
-            print("  ✓ Keep user code: Enabled")
+            yield "pass", "Keep user code: Enabled"
 
         delete_prev = self.get_value("ProjectManager.DeletePrevious", "")
         if delete_prev == "true":
-            self.warnings.append(
-                "Code generation 'DeletePrevious' is enabled - may remove platform files"
-            )
+            yield "warning", "Code generation 'DeletePrevious' is enabled - may remove platform files"
+
+    # Report sections, in order, with the check generator for each
+    _SECTIONS = (
+        ("DMA Configuration", _rules_dma),
+        ("Interrupt Configuration", _rules_interrupts),
+        ("Clock Configuration", _rules_clock),
+        ("CAN Configuration", _rules_can),
+        ("Code Generation Settings", _rules_code_generation),
+    )
 
     def run_validation(self) -> bool:
-        """Run all validation checks"""
-        print(f"\n{'=' * 60}")
-        print(f"STM32CubeMX Configuration Validator")
-        print(f"File: {self.ioc_path.name}")
-        print(f"{'=' * 60}")
-
-        self.validate_dma_config()
-        self.validate_interrupts()
-        self.validate_clock_config()
-        self.validate_can_config()
-        self.validate_code_generation()
+        """Run all validation checks and print the report"""
+        success = self.validate()
+        sys.stdout.write(self.report())
+        return success
+
+    def report(self) -> str:
+        """Get the report collected by validate()"""
+        return "\n".join(self._out) + "\n"
+
+    def validate(self) -> bool:
+        """Run all validation checks, collecting the report without printing it"""
+        self._out.append(HEADER_TMPL.format_map({"name": self.ioc_path.name}))
+
+        for title, rules in self._SECTIONS:
+            self._out.append(f"\n[{title}]")
+            for severity, message in rules(self):
+                if severity == "error":
+                    self.errors.append(message)
+                elif severity == "warning":
+                    self.warnings.append(message)
+                else:
+                    self._out.append(f"  ✓ {message}")
 
         # Print results
-        print(f"\n{'=' * 60}")
-        print("Validation Results")
-        print(f"{'=' * 60}")
+        self._out.append(RESULTS_BANNER)
 
         if not self.errors and not self.warnings:
-            print("\n✓ All checks passed! Configuration meets platform requirements.")
-            return True
-
-        if self.errors:
-            print(f"\n❌ ERRORS ({len(self.errors)}):")
-            for i, error in enumerate(self.errors, 1):
-                print(f"  {i}. {error}")
-
-        if self.warnings:
-            print(f"\n⚠ WARNINGS ({len(self.warnings)}):")
-            for i, warning in enumerate(self.warnings, 1):
-                print(f"  {i}. {warning}")
-
-        if self.errors:
-            print("\n❌ Configuration FAILED validation. Fix errors before proceeding.")
-            return False
+            self._out.append("\n✓ All checks passed! Configuration meets platform requirements.")
+            success = True
         else:
-            print("\n⚠ Configuration passed with warnings. Review recommendations.")
-            return True
+            if self.errors:
+                self._out.append(f"\n❌ ERRORS ({len(self.errors)}):")
+                for i, error in enumerate(self.errors, 1):
+                    self._out.append(f"  {i}. {error}")
 
+            if self.warnings:
+                self._out.append(f"\n⚠ WARNINGS ({len(self.warnings)}):")
+                for i, warning in enumerate(self.warnings, 1):
+                    self._out.append(f"  {i}. {warning}")
 
-def main():
-    """Main entry point"""
-    if len(sys.argv) != 2:
-        print("Usage: python validate_cubemx_config.py <path_to_project.ioc>")
-        sys.exit(1)
+            if self.errors:
+                self._out.append("\n❌ Configuration FAILED validation. Fix errors before proceeding.")
+                success = False
+            else:
+                self._out.append("\n⚠ Configuration passed with warnings. Review recommendations.")
+                success = True
+
+        return success
 
-    ioc_path = Path(sys.argv[1])
 
+def _validate_one(ioc_path: Path) -> Tuple[Path, bool, str]:
+    """Validate a single file in a worker process (top-level so it pickles)
+
+    Errors are reported as a failed result for this file rather than raised,
+    so one unreadable file cannot abort the rest of the batch.
+    """
     try:
         validator = IocValidator(ioc_path)
-        success = validator.run_validation()
-        sys.exit(0 if success else 1)
+        success = validator.validate()
+        return ioc_path, success, validator.report()
+    except Exception as e:
+        return ioc_path, False, f"\n❌ {ioc_path}: {type(e).__name__}: {e}\n"
+
+
+def collect_ioc_paths(args: List[str]) -> List[Path]:
+    """Expand command-line arguments into .ioc paths, searching directories recursively
+
+    A file named more than once (directly or via a directory) is kept only at
+    its first occurrence.
+    """
+    paths: Dict[Path, Path] = {}  # resolved -> path as given, in first-seen order
+    for arg in args:
+        path = Path(arg)
+        if path.is_dir():
+            found = sorted(path.rglob("*.ioc"))
+            if not found:
+                raise FileNotFoundError(f"No .ioc files found in directory: {path}")
+        elif path.is_file():
+            found = [path]
+        else:
+            raise FileNotFoundError(f"IOC file not found: {path}")
+        for ioc_path in found:
+            paths.setdefault(ioc_path.resolve(), ioc_path)
+    return list(paths.values())
+
+
+def validate_batch(paths: List[Path]) -> Dict[Path, bool]:
+    """Validate several files in parallel, printing each report in order"""
+    if len(paths) == 1:
+        # e.g. the only file left after the cache; not worth starting a pool
+        results = [_validate_one(paths[0])]
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_validate_one, paths))
+
+    outcome: Dict[Path, bool] = {}
+    for ioc_path, success, report in results:
+        sys.stdout.write(report)
+        outcome[ioc_path] = success
+    return outcome
+
+
+def print_summary(results: Dict[Path, bool]):
+    """Print the pass/fail summary for a multi-file run"""
+    failed = [ioc_path for ioc_path, success in results.items() if not success]
+
+    print(SUMMARY_TMPL.format_map({"passed": len(results) - len(failed), "total": len(results)}))
+    for ioc_path in failed:
+        print(f"  ❌ {ioc_path}")
+
+
+def file_digest(path: Path) -> str:
+    """Get a 128-bit BLAKE2b fingerprint of a file's contents"""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def load_cache(cache_path: Path) -> Dict[str, List]:
+    """Load cached {path: [digest, success]} results, discarding a stale or unreadable cache"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    # Results only hold for the validator (and requirements) that produced them
+    if not isinstance(cache, dict) or cache.get("validator") != file_digest(Path(__file__)):
+        return {}
+
+    # Drop malformed entries so they are treated as cache misses
+    files = cache.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {
+        path: entry for path, entry in files.items()
+        if isinstance(entry, list) and len(entry) == 2
+        and isinstance(entry[0], str) and isinstance(entry[1], bool)
+    }
+
+
+def save_cache(cache_path: Path, files: Dict[str, List]):
+    """Write cached results together with the current validator fingerprint
+
+    The cache is only an optimisation: failing to write it prints a warning
+    but never changes the validation result. It is written to a temporary
+    file and swapped into place, so an interrupted write cannot leave a
+    truncated cache behind.
+    """
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump({"validator": file_digest(Path(__file__)), "files": files}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: could not write cache file {cache_path}: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Validate STM32CubeMX .ioc files against STM32 Platform requirements."
+    )
+    parser.add_argument(
+        "paths", nargs="+", metavar="path",
+        help=".ioc file or directory to search recursively for .ioc files",
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="skip files unchanged since their last validation and reuse the cached result",
+    )
+    parser.add_argument(
+        "--cache-file", type=Path, default=DEFAULT_CACHE_FILE, metavar="FILE",
+        help=f"where --cache stores results (default: {DEFAULT_CACHE_FILE})",
+    )
+    args = parser.parse_args()
+
+    try:
+        paths = collect_ioc_paths(args.paths)
+        cache = load_cache(args.cache_file) if args.cache else {}
+
+        results: Dict[Path, bool] = {}
+        digests: Dict[Path, str] = {}
+        pending: List[Path] = []
+        for ioc_path in paths:
+            if args.cache:
+                digests[ioc_path] = digest = file_digest(ioc_path)
+                entry = cache.get(str(ioc_path.resolve()))
+                if entry and entry[0] == digest:
+                    results[ioc_path] = entry[1]
+                    status = "passed" if entry[1] else "FAILED"
+                    print(f"{'✓' if entry[1] else '❌'} {ioc_path}: unchanged, previously {status} (cached)")
+                    continue
+            pending.append(ioc_path)
+
+        if len(paths) == 1 and pending:
+            results[pending[0]] = IocValidator(pending[0]).run_validation()
+        elif pending:
+            results.update(validate_batch(pending))
+
+        if args.cache:
+            for ioc_path in pending:
+                cache[str(ioc_path.resolve())] = [digests[ioc_path], results[ioc_path]]
+            save_cache(args.cache_file, cache)
+
+        if len(paths) > 1:
+            print_summary({ioc_path: results[ioc_path] for ioc_path in paths})
+        sys.exit(0 if all(results.values()) else 1)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)